@@ -1,5 +1,7 @@
 from fastapi import APIRouter
-from .routes import chat
+from .routes import cache, chat, sync
 
 api_router = APIRouter()
-api_router.include_router(chat.router, prefix="/chat")
\ No newline at end of file
+api_router.include_router(chat.router, prefix="/chat")
+api_router.include_router(sync.router, prefix="/sync")
+api_router.include_router(cache.router, prefix="/cache")
\ No newline at end of file
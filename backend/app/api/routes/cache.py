@@ -0,0 +1,32 @@
+import os
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from app.deps.dependency_container import di_container_instance
+
+router = APIRouter()
+
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+def require_cache_admin(request: Request, x_admin_token: Optional[str] = Header(None)):
+    # With CACHE_ADMIN_TOKEN set, callers must send it in X-Admin-Token.
+    # Without it, only requests from the host itself are accepted.
+    token = os.getenv("CACHE_ADMIN_TOKEN")
+    if token:
+        if not x_admin_token or not secrets.compare_digest(x_admin_token, token):
+            raise HTTPException(status_code=403, detail="Invalid admin token")
+    elif request.client is None or request.client.host not in LOOPBACK_HOSTS:
+        raise HTTPException(status_code=403, detail="Cache admin is only allowed from localhost")
+
+
+# Writes made through the MCP tools already invalidate the cache, because
+# the data version is part of every key. Call this only when answers go
+# stale some other way: data edited directly in Postgres, a migration, or a
+# change to the model or system prompt.
+@router.post("/invalidate", summary="Invalidate cached answers in every worker", dependencies=[Depends(require_cache_admin)])
+async def invalidate_cache(
+    answer_cache = Depends(di_container_instance.get_answer_cache),
+):
+    generation = await answer_cache.invalidate()
+    return {"status": "ok", "generation": generation}
@@ -1,6 +1,10 @@
 from fastapi import APIRouter, BackgroundTasks, Depends
 from app.api.schemas.chat import ChatRequest
 from app.deps.dependency_container import di_container_instance
+from app.services.answer_cache import MUTATING_TOOL_PREFIXES, has_tool_error, make_cache_key
+from app.services.agent import get_token_usage
+import logging
+import time
 
 router = APIRouter()
 
@@ -26,10 +30,39 @@ def get_last_message_text(response):
 async def chat(
     req: ChatRequest,
     #background_tasks: BackgroundTasks,
-    agent = Depends(di_container_instance.get_agent_instance)
+    agent_variants = Depends(di_container_instance.get_agent_variants),
+    answer_cache = Depends(di_container_instance.get_answer_cache),
+    data_version_client = Depends(di_container_instance.get_data_version_client),
 ):
+    started = time.perf_counter()
     try:
+        # 0. Serve repeated questions from the cache while the data is unchanged
+        data_version = await data_version_client.get_version()
+        cache_key = None
+        if data_version is not None:
+            cache_key = make_cache_key(req.message, data_version)
+            cached = await answer_cache.get(cache_key)
+            if cached is not None:
+                # Report this request's cost, not the cost of the run that filled the cache
+                return {**cached, "metadata": {
+                    **cached["metadata"],
+                    "cached": True,
+                    "latency_ms": round((time.perf_counter() - started) * 1000),
+                    "input_tokens": 0,
+                    "output_tokens": 0
+                }}
+
+        # Only bind the tools this message needs, fewer schemas means a smaller prompt every round
+        agent, tool_names = agent_variants.for_message(req.message)
+
         response = await agent.ainvoke({"messages": [("user", req.message)]})
+        latency_ms = round((time.perf_counter() - started) * 1000)
+        usage = get_token_usage(response)
+        logging.info(
+            f"Agent run: {len(tool_names)}/{len(agent_variants.tool_names)} tools, "
+            f"{usage['input_tokens']} input tokens, {latency_ms} ms"
+        )
+
         # 1. Grab the raw content
         raw_content = response["messages"][-1].content
         
@@ -54,13 +87,27 @@ async def chat(
         unique_tools = list(set(tools_used))
 
         # 4. Return the guaranteed string
-        return {
+        result = {
             "role": "assistant", 
             "content": final_message,
             "metadata": {
-                "tools_executed": unique_tools
+                "tools_executed": unique_tools,
+                "cached": False,
+                "tools_offered": sorted(tool_names),
+                "latency_ms": latency_ms,
+                **usage
             }
         }
+
+        # 5. Only cache successful read-only runs. A write makes the answer stale
+        # immediately, and a failed tool (e.g. Postgres briefly down) would pin
+        # an "I couldn't access your data" reply until the next write.
+        mutated = any(name.startswith(MUTATING_TOOL_PREFIXES) for name in unique_tools)
+        failed = has_tool_error(response["messages"])
+        if cache_key is not None and not mutated and not failed:
+            await answer_cache.set(cache_key, result)
+
+        return result
         
     except Exception as e:
-        return {"role": "assistant", "content": f"System Error: {str(e)}", "metadata": {"tools_executed": []}}
\ No newline at end of file
+        return {"role": "assistant", "content": f"System Error: {str(e)}", "metadata": {"tools_executed": [], "cached": False}}
\ No newline at end of file
@@ -0,0 +1,32 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Response
+from fastapi.responses import JSONResponse
+from app.deps.dependency_container import di_container_instance
+
+router = APIRouter()
+
+@router.get("/{table}", summary="Delta sync API")
+async def sync_table(
+    table: str,
+    since: int = Query(0, ge=0, description="Change-sequence cursor from the previous response, 0 for a full snapshot"),
+    limit: Optional[int] = Query(None, ge=1),
+    after: Optional[str] = Query(None, description="Snapshot continuation, from the previous page's snapshot.after"),
+    snapshot_seq: Optional[int] = Query(None, ge=0, description="Snapshot continuation, from the previous page's snapshot.seq"),
+    if_none_match: Optional[str] = Header(None),
+    sync_proxy = Depends(di_container_instance.get_sync_proxy),
+):
+    try:
+        upstream = await sync_proxy.get_changes(table, since, limit, if_none_match, after, snapshot_seq)
+    except Exception as e:
+        return JSONResponse({"error": f"Sync unavailable: {str(e)}"}, status_code=502)
+
+    # Pass the body through untouched, GZipMiddleware compresses it on the way out
+    headers = {"ETag": upstream.headers["etag"]} if "etag" in upstream.headers else {}
+    if upstream.status_code == 304:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=upstream.content,
+        status_code=upstream.status_code,
+        headers=headers,
+        media_type="application/json",
+    )
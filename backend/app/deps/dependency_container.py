@@ -1,5 +1,9 @@
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain_core.language_models.chat_models import BaseChatModel
+from app.services.answer_cache import AnswerCache, DataVersionClient
+from app.services.sync_proxy import SyncProxy
+from app.services.agent import AgentVariants
+from app.services.shared_state import SharedStore
 
 class DIContainer:
     def __init__(self):
@@ -7,6 +11,11 @@ class DIContainer:
         self._llm_client: BaseChatModel = None
         self._mcp_server_client: MultiServerMCPClient = None
         self._agent_instance = None
+        self._agent_variants: AgentVariants = None
+        self._shared_store: SharedStore = None
+        self._answer_cache: AnswerCache = None
+        self._data_version_client: DataVersionClient = None
+        self._sync_proxy: SyncProxy = None
 
     # --- Embedding Client ---
     @property
@@ -49,4 +58,61 @@ class DIContainer:
     def get_agent_instance(self):
         return self._agent_instance
 
+    # --- Agent Variants (per tool subset) ---
+    @property
+    def agent_variants(self) -> AgentVariants:
+        return self._agent_variants
+
+    @agent_variants.setter
+    def agent_variants(self, value: AgentVariants):
+        self._agent_variants = value
+
+    def get_agent_variants(self) -> AgentVariants:
+        return self._agent_variants
+
+    # --- Shared State Store ---
+    @property
+    def shared_store(self) -> SharedStore:
+        return self._shared_store
+
+    @shared_store.setter
+    def shared_store(self, value: SharedStore):
+        self._shared_store = value
+
+    # --- Answer Cache ---
+    @property
+    def answer_cache(self) -> AnswerCache:
+        return self._answer_cache
+
+    @answer_cache.setter
+    def answer_cache(self, value: AnswerCache):
+        self._answer_cache = value
+
+    def get_answer_cache(self) -> AnswerCache:
+        return self._answer_cache
+
+    # --- Data Version Client ---
+    @property
+    def data_version_client(self) -> DataVersionClient:
+        return self._data_version_client
+
+    @data_version_client.setter
+    def data_version_client(self, value: DataVersionClient):
+        self._data_version_client = value
+
+    def get_data_version_client(self) -> DataVersionClient:
+        return self._data_version_client
+
+    # --- Sync Proxy ---
+    @property
+    def sync_proxy(self) -> SyncProxy:
+        return self._sync_proxy
+
+    @sync_proxy.setter
+    def sync_proxy(self, value: SyncProxy):
+        self._sync_proxy = value
+
+    def get_sync_proxy(self) -> SyncProxy:
+        return self._sync_proxy
+
 di_container_instance = DIContainer()
\ No newline at end of file
@@ -1,11 +1,16 @@
+import os
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain_google_genai import ChatGoogleGenerativeAI
+from app.services.answer_cache import AnswerCache, DataVersionClient
+from app.services.sync_proxy import SyncProxy
+from app.services.shared_state import MemoryStore, SharedStore, SqliteStore
 
+MCP_SERVER_URL = "http://localhost:8000"
 
 def get_mcp_client() -> MultiServerMCPClient:
     return MultiServerMCPClient({
         "finance_server": {
-            "url": "http://localhost:8000/mcp",
+            "url": f"{MCP_SERVER_URL}/mcp",
             "transport": "http",
         }
     })
@@ -14,4 +19,22 @@ def get_llm_client() -> ChatGoogleGenerativeAI:
     return ChatGoogleGenerativeAI(
         model="gemini-3-flash-preview", 
         temperature=0 
-    )
\ No newline at end of file
+    )
+
+def get_shared_store() -> SharedStore:
+    # Read at call time, .env is only loaded once the app module has imported us
+    backend = os.getenv("SHARED_STATE_BACKEND", "memory")
+    if backend == "sqlite":
+        return SqliteStore(os.getenv("SHARED_STATE_PATH", "shared_state.db"))
+    if backend == "memory":
+        return MemoryStore()
+    raise ValueError(f"Unknown SHARED_STATE_BACKEND '{backend}', expected 'memory' or 'sqlite'")
+
+def get_answer_cache(store: SharedStore) -> AnswerCache:
+    return AnswerCache(store, max_size=256)
+
+def get_data_version_client() -> DataVersionClient:
+    return DataVersionClient(f"{MCP_SERVER_URL}/data-version")
+
+def get_sync_proxy() -> SyncProxy:
+    return SyncProxy(MCP_SERVER_URL)
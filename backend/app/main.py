@@ -1,15 +1,23 @@
 # backend/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from langchain.agents import create_agent
 from datetime import date
 import asyncio
 import os
 import logging
 from app.deps.dependency_container import di_container_instance
-from app.deps.dependency_factory import get_llm_client, get_mcp_client
+from app.services.agent import AgentVariants
+from app.deps.dependency_factory import (
+    get_llm_client,
+    get_mcp_client,
+    get_shared_store,
+    get_answer_cache,
+    get_data_version_client,
+    get_sync_proxy,
+)
 
 import logging
 import sys
@@ -38,11 +46,24 @@ async def lifespan(app: FastAPI):
     #yield
     #shutdown process started dispose of db engine etc
 
-    logging.info("Starting LangChain Orchestrator...")
+    # Runs once in every worker process, each worker warms up its own MCP
+    # client and agents while shared state goes through the shared store
+    logging.info(f"Starting LangChain Orchestrator (worker pid {os.getpid()})...")
     logging.info("Connecting to Finance MCP Server...")
 
     di_container_instance.mcp_server_client = get_mcp_client()
     di_container_instance.llm_client = get_llm_client()
+    di_container_instance.shared_store = get_shared_store()
+    di_container_instance.answer_cache = get_answer_cache(di_container_instance.shared_store)
+
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1 and not di_container_instance.shared_store.shared_across_processes:
+        logging.warning(
+            f"{type(di_container_instance.shared_store).__name__} is per-process but WORKERS={workers}, "
+            "caches will not be shared between workers (set SHARED_STATE_BACKEND=sqlite)"
+        )
+    di_container_instance.data_version_client = get_data_version_client()
+    di_container_instance.sync_proxy = get_sync_proxy()
 
     tools = await di_container_instance.mcp_server_client.get_tools()
     logging.info(f"Loaded tools: {[t.name for t in tools]}")
@@ -51,10 +72,16 @@ async def lifespan(app: FastAPI):
     today = date.today().isoformat()
     system_prompt = f"You are a helpful personal assistant. Today's exact date is {today}."
 
-    di_container_instance.agent_instance = create_agent(di_container_instance.llm_client, tools, system_prompt=system_prompt)
+    # Agents are built per tool subset on demand, the full set is built up front
+    di_container_instance.agent_variants = AgentVariants(di_container_instance.llm_client, tools, system_prompt)
+    di_container_instance.agent_instance = di_container_instance.agent_variants.get(di_container_instance.agent_variants.tool_names)
     
     yield
 
+    await di_container_instance.data_version_client.aclose()
+    await di_container_instance.sync_proxy.aclose()
+    di_container_instance.shared_store.close()
+
 def create_app() -> FastAPI:
     app = FastAPI(lifespan=lifespan, title="Life OS LangChain Backend")
 
@@ -72,7 +99,9 @@ def create_app() -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=["ETag"],
         )
+        app.add_middleware(GZipMiddleware, minimum_size=1000)
     except Exception as e:
         logging.warning("Api router not loaded: %s", e)
 
@@ -0,0 +1,45 @@
+from langchain.agents import create_agent
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.tools import BaseTool
+import logging
+
+from app.services.tool_selector import select_tool_names
+
+
+class AgentVariants:
+    """Builds and reuses one agent per distinct tool subset."""
+
+    def __init__(self, llm_client: BaseChatModel, tools: list[BaseTool], system_prompt: str):
+        self._llm_client = llm_client
+        self._tools = {tool.name: tool for tool in tools}
+        self._system_prompt = system_prompt
+        self._variants = {}
+
+    @property
+    def tool_names(self) -> frozenset[str]:
+        return frozenset(self._tools)
+
+    def get(self, tool_names: frozenset[str]):
+        agent = self._variants.get(tool_names)
+        if agent is None:
+            logging.info(f"Building agent variant with tools: {sorted(tool_names)}")
+            tools = [tool for name, tool in self._tools.items() if name in tool_names]
+            agent = create_agent(self._llm_client, tools, system_prompt=self._system_prompt)
+            self._variants[tool_names] = agent
+        return agent
+
+    def for_message(self, message: str):
+        tool_names = select_tool_names(message, self.tool_names)
+        return self.get(tool_names), tool_names
+
+
+def get_token_usage(response) -> dict[str, int]:
+    # Summed over every LLM round of the run, providers that don't report
+    # usage_metadata simply contribute nothing
+    usage = {"input_tokens": 0, "output_tokens": 0}
+    for msg in response["messages"]:
+        usage_metadata = getattr(msg, "usage_metadata", None)
+        if usage_metadata:
+            usage["input_tokens"] += usage_metadata.get("input_tokens", 0)
+            usage["output_tokens"] += usage_metadata.get("output_tokens", 0)
+    return usage
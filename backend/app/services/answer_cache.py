@@ -0,0 +1,135 @@
+from datetime import date
+import asyncio
+import json
+import logging
+import re
+
+import httpx
+
+from app.services.shared_state import SharedStore
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Tools that change stored data. A run that calls one of these must never be
+# served from the cache.
+MUTATING_TOOL_PREFIXES = ("log_", "delete_")
+
+
+# The MCP tools catch their own exceptions and return these shapes instead
+# (see mcp_server/*/tools.py), so a failed lookup looks like a normal result.
+TOOL_ERROR_PREFIXES = ("Failed to", "Error:")
+
+
+def _tool_message_text(msg) -> str:
+    content = msg.content
+    if isinstance(content, list):
+        return "\n".join(
+            block.get("text", "") if isinstance(block, dict) else str(block) for block in content
+        )
+    return str(content)
+
+
+def _looks_like_tool_error(text: str) -> bool:
+    text = text.strip()
+    if text.startswith(TOOL_ERROR_PREFIXES):
+        return True
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return False
+    if isinstance(payload, dict):
+        return "error" in payload
+    if isinstance(payload, list):
+        return any(isinstance(item, dict) and "error" in item for item in payload)
+    return False
+
+
+def has_tool_error(messages) -> bool:
+    """True if any tool call in the run failed, its answer must not be cached."""
+    for msg in messages:
+        if getattr(msg, "type", None) != "tool":
+            continue
+        if getattr(msg, "status", None) == "error" or _looks_like_tool_error(_tool_message_text(msg)):
+            return True
+    return False
+
+
+def normalise_message(message: str) -> str:
+    return _WHITESPACE_RE.sub(" ", message).strip().casefold()
+
+
+def make_cache_key(message: str, data_version: int) -> tuple[str, str, int]:
+    # The date is part of the key because answers like "this month" depend on it
+    return (normalise_message(message), date.today().isoformat(), data_version)
+
+
+class AnswerCache:
+    """
+    LRU cache of final agent answers keyed by (message, date, data version).
+
+    Entries live in a shared-state store so that, with the SQLite backend,
+    every worker serves the same cache. Keys are also scoped by a generation
+    counter kept in the store: bumping it with invalidate() is the
+    cross-worker invalidation channel, every worker stops seeing old entries
+    on its next lookup and LRU eviction drops them over time.
+    """
+
+    NAMESPACE = "answers"
+    GENERATION_NAMESPACE = "invalidation"
+    GENERATION_KEY = "answer_cache"
+
+    def __init__(self, store: SharedStore, max_size: int = 256):
+        self.max_size = max_size
+        self._store = store
+
+    def _scoped_key(self, key: tuple) -> str:
+        # Plain read, looking up the generation must not write to the store
+        generation = self._store.get(self.GENERATION_NAMESPACE, self.GENERATION_KEY, touch=False) or 0
+        return json.dumps([generation, *key])
+
+    def _get(self, key: tuple) -> dict | None:
+        return self._store.get(self.NAMESPACE, self._scoped_key(key))
+
+    def _set(self, key: tuple, value: dict) -> None:
+        self._store.set(self.NAMESPACE, self._scoped_key(key), value, max_entries=self.max_size)
+
+    # Store I/O (SQLite) runs in a thread to keep it off the event loop. A
+    # store error is a cache miss, never a failed chat request.
+    async def get(self, key: tuple) -> dict | None:
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except Exception as e:
+            logging.warning("Answer cache read failed, treating as a miss: %s", e)
+            return None
+
+    async def set(self, key: tuple, value: dict) -> None:
+        try:
+            await asyncio.to_thread(self._set, key, value)
+        except Exception as e:
+            logging.warning("Answer cache write failed, skipping: %s", e)
+
+    async def invalidate(self) -> int:
+        """Invalidate every cached answer in all workers, returns the new generation."""
+        return await asyncio.to_thread(self._store.incr, self.GENERATION_NAMESPACE, self.GENERATION_KEY)
+
+
+class DataVersionClient:
+    """Reads the MCP server's data-version counter over plain HTTP."""
+
+    def __init__(self, url: str, timeout: float = 0.5):
+        self._url = url
+        self._http = httpx.AsyncClient(timeout=timeout)
+
+    async def get_version(self) -> int | None:
+        # None means "unknown", callers should skip the cache rather than
+        # risk serving a stale answer
+        try:
+            response = await self._http.get(self._url)
+            response.raise_for_status()
+            return int(response.json()["data_version"])
+        except Exception as e:
+            logging.warning("Could not read data version: %s", e)
+            return None
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
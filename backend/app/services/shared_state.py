@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from typing import Any, Protocol
+import json
+import sqlite3
+import threading
+import time
+
+
+class SharedStore(Protocol):
+    """
+    Small namespaced key/value API every shared-state backend implements.
+    Values must be JSON serialisable. Pick a backend with
+    SHARED_STATE_BACKEND (see dependency_factory).
+    """
+
+    # False when each worker process gets its own copy of the data
+    shared_across_processes: bool
+
+    def get(self, namespace: str, key: str, touch: bool = True) -> Any: ...
+
+    def set(self, namespace: str, key: str, value: Any, max_entries: int | None = None) -> None: ...
+
+    def incr(self, namespace: str, key: str) -> int: ...
+
+    def close(self) -> None: ...
+
+
+class MemoryStore:
+    """Process-local store. Fast, but every worker gets its own copy."""
+
+    shared_across_processes = False
+
+    def __init__(self):
+        self._namespaces: dict[str, OrderedDict] = {}
+        self._lock = threading.Lock()
+
+    def _ns(self, namespace: str) -> OrderedDict:
+        return self._namespaces.setdefault(namespace, OrderedDict())
+
+    def get(self, namespace: str, key: str, touch: bool = True):
+        with self._lock:
+            entries = self._ns(namespace)
+            if key not in entries:
+                return None
+            if touch:
+                entries.move_to_end(key)
+            return entries[key]
+
+    def set(self, namespace: str, key: str, value, max_entries: int | None = None) -> None:
+        with self._lock:
+            entries = self._ns(namespace)
+            entries[key] = value
+            entries.move_to_end(key)
+            while max_entries is not None and len(entries) > max_entries:
+                entries.popitem(last=False)
+
+    def incr(self, namespace: str, key: str) -> int:
+        with self._lock:
+            entries = self._ns(namespace)
+            entries[key] = int(entries.get(key) or 0) + 1
+            return entries[key]
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteStore:
+    """
+    Store backed by a local SQLite file in WAL mode, shared by every worker
+    on the host without running any extra service.
+
+    The LRU is approximate. A read only refreshes accessed_at once it is
+    older than touch_interval seconds, so a hot key costs one write per
+    interval instead of one per lookup. The busy timeout is short because
+    callers (caches) should treat a locked database as a miss rather than
+    wait.
+    """
+
+    shared_across_processes = True
+
+    def __init__(self, path: str, timeout: float = 1.0, touch_interval: float = 60.0):
+        self._touch_interval = touch_interval
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS kv ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS kv_lru ON kv (namespace, accessed_at)")
+
+    def get(self, namespace: str, key: str, touch: bool = True):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, accessed_at FROM kv WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if touch and now - row[1] > self._touch_interval:
+                try:
+                    self._conn.execute(
+                        "UPDATE kv SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                        (now, namespace, key),
+                    )
+                except sqlite3.OperationalError:
+                    # Best effort, a busy database must not fail the read
+                    pass
+            return json.loads(row[0])
+
+    def set(self, namespace: str, key: str, value, max_entries: int | None = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (namespace, key, value, accessed_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), time.time()),
+            )
+            if max_entries is not None:
+                # Evict least recently used entries beyond the bound
+                self._conn.execute(
+                    "DELETE FROM kv WHERE namespace = ? AND key IN ("
+                    " SELECT key FROM kv WHERE namespace = ?"
+                    " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (namespace, namespace, max_entries),
+                )
+
+    def incr(self, namespace: str, key: str) -> int:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            row = self._conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            value = (json.loads(row[0]) if row else 0) + 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO kv (namespace, key, value, accessed_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value), time.time()),
+            )
+            return value
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
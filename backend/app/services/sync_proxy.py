@@ -0,0 +1,26 @@
+import httpx
+
+
+class SyncProxy:
+    """Forwards delta-sync reads to the MCP server, which owns the database."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self._http = httpx.AsyncClient(base_url=base_url, timeout=timeout)
+
+    async def get_changes(
+        self,
+        table: str,
+        since: int,
+        limit: int | None,
+        if_none_match: str | None,
+        after: str | None = None,
+        snapshot_seq: int | None = None,
+    ) -> httpx.Response:
+        params = {"since": since}
+        optional = {"limit": limit, "after": after, "snapshot_seq": snapshot_seq}
+        params.update({name: value for name, value in optional.items() if value is not None})
+        headers = {"If-None-Match": if_none_match} if if_none_match else {}
+        return await self._http.get(f"/sync/{table}", params=params, headers=headers)
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
@@ -0,0 +1,52 @@
+import re
+
+# Each domain's tools are offered as a unit so delete_* is never bound
+# without the get_* tool the agent needs to look up the id first.
+#
+# Keywords are prefixes of lowercased words ("exercis" covers exercise,
+# exercises, exercising). Words that can mean time as well as money
+# ("spend", "spent", "pay", "cost") are deliberately absent: "I spent an
+# hour on the rowing machine" is a workout. When they are the only hint,
+# no domain matches and the agent gets every tool.
+TOOL_DOMAINS = {
+    "expenses": {
+        "keywords": (
+            "expense", "bought", "buy", "purchase", "money", "budget", "price",
+            "dollar", "euro", "bill", "grocer", "$", "€",
+        ),
+        "tools": ("log_expense", "get_expenses", "delete_expense", "get_spending_summary"),
+    },
+    "exercises": {
+        "keywords": (
+            "workout", "exercis", "gym", "train", "run", "jog", "walk", "hike",
+            "swim", "cycl", "bike", "rowing", "treadmill", "elliptical", "lift",
+            "squat", "bench", "deadlift", "press", "push", "pull", "sets", "reps",
+            "cardio", "strength", "km", "mile",
+        ),
+        "tools": ("log_exercise", "get_workouts", "delete_exercise", "get_workout_summary"),
+    },
+}
+
+_TOKEN_RE = re.compile(r"[a-z]+|[$€]")
+
+
+def select_tool_names(message: str, available: frozenset[str]) -> frozenset[str]:
+    """
+    Pick the tools relevant to a message by domain keywords.
+
+    Falls back to every available tool when no domain (or every domain)
+    matches, so an ambiguous question is never answered with missing tools.
+    Tools that belong to no domain are always kept.
+    """
+    tokens = _TOKEN_RE.findall(message.casefold())
+    matched = [
+        domain for domain, spec in TOOL_DOMAINS.items()
+        if any(token.startswith(keyword) for token in tokens for keyword in spec["keywords"])
+    ]
+
+    if not matched or len(matched) == len(TOOL_DOMAINS):
+        return available
+
+    domain_tools = {name for spec in TOOL_DOMAINS.values() for name in spec["tools"]}
+    selected = {name for domain in matched for name in TOOL_DOMAINS[domain]["tools"]}
+    return frozenset((selected | (available - domain_tools)) & available)
@@ -0,0 +1,72 @@
+# backend/scripts/bench_tool_selection.py
+"""
+Compare prompt tokens and latency of the full tool set against the
+per-request subset picked by select_tool_names.
+
+Needs the MCP server running and the LLM credentials in ../.env.
+Run from ./backend:  python -m scripts.bench_tool_selection [--rounds 3]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date
+
+from dotenv import load_dotenv
+
+from app.deps.dependency_factory import get_llm_client, get_mcp_client
+from app.services.agent import AgentVariants, get_token_usage
+
+# Read-only questions only, the benchmark must not write to the database
+PROMPTS = [
+    "How much have I spent this month?",
+    "What did I spend on food last week?",
+    "Show me my spending summary for this year.",
+    "How far did I run this month?",
+    "What workouts did I do last week?",
+    "How many minutes did I train this year?",
+]
+
+
+async def run_once(agent, message: str) -> tuple[int, float]:
+    started = time.perf_counter()
+    response = await agent.ainvoke({"messages": [("user", message)]})
+    latency_ms = (time.perf_counter() - started) * 1000
+    return get_token_usage(response)["input_tokens"], latency_ms
+
+
+async def main(rounds: int):
+    load_dotenv("../.env")
+    tools = await get_mcp_client().get_tools()
+    system_prompt = f"You are a helpful personal assistant. Today's exact date is {date.today().isoformat()}."
+    variants = AgentVariants(get_llm_client(), tools, system_prompt)
+    full_agent = variants.get(variants.tool_names)
+
+    results = {"full": ([], []), "selected": ([], [])}
+    for _ in range(rounds):
+        for message in PROMPTS:
+            selected_agent, tool_names = variants.for_message(message)
+            for label, agent in (("full", full_agent), ("selected", selected_agent)):
+                tokens, latency_ms = await run_once(agent, message)
+                results[label][0].append(tokens)
+                results[label][1].append(latency_ms)
+            print(f"{len(tool_names)}/{len(variants.tool_names)} tools  {message}")
+
+    print()
+    print(f"{'tool set':<10} {'input tokens/req':>18} {'median latency ms':>18}")
+    for label, (tokens, latencies) in results.items():
+        print(f"{label:<10} {statistics.mean(tokens):>18.0f} {statistics.median(latencies):>18.0f}")
+
+    full_tokens = statistics.mean(results["full"][0])
+    if full_tokens:
+        saved = 1 - statistics.mean(results["selected"][0]) / full_tokens
+        print(f"\nInput tokens saved by tool selection: {saved:.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
@@ -0,0 +1,161 @@
+# backend/scripts/bench_workers.py
+#
+# Measure request throughput of the backend for a range of worker counts.
+# Starts serve.py once per worker count, waits for it to warm up, then
+# drives it from several client processes so the load generator is not
+# the bottleneck.
+#
+# By default it sends one repeated chat question. After a single priming
+# request (one real agent run), every request goes through the shared
+# answer cache: a data-version check plus a shared-store lookup in
+# whichever worker serves it. So the numbers cover the shared-state path,
+# and the hit ratio shows that all workers see the same cache. Use --path
+# to GET a plain route instead.
+#
+# Needs the MCP server running (every worker connects to it on startup)
+# and LLM credentials for the priming request.
+# Run from ./backend:  python -m scripts.bench_workers --workers 1 2 4
+import argparse
+import asyncio
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+async def _drive(url: str, body: dict | None, duration: float, concurrency: int, counts: dict):
+    deadline = time.perf_counter() + duration
+
+    async def worker(client: httpx.AsyncClient):
+        while time.perf_counter() < deadline:
+            try:
+                if body is None:
+                    response = await client.get(url)
+                else:
+                    response = await client.post(url, json=body)
+            except httpx.HTTPError:
+                counts["errors"] += 1
+                continue
+            if response.status_code >= 500:
+                counts["errors"] += 1
+                continue
+            counts["ok"] += 1
+            if b'"cached":true' in response.content:
+                counts["cache_hits"] += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+
+
+def _client_process(url: str, body: dict | None, duration: float, concurrency: int, results):
+    counts = {"ok": 0, "cache_hits": 0, "errors": 0}
+    try:
+        asyncio.run(_drive(url, body, duration, concurrency, counts))
+    finally:
+        # Always report, measure() waits for one result per client process
+        results.put(counts)
+
+
+def wait_until_ready(base_url: str, timeout: float = 120.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(f"{base_url}/healthz", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Backend at {base_url} did not become ready")
+
+
+def prime_cache(url: str, body: dict):
+    """
+    Fill the shared cache with one real agent run, then confirm the next
+    request is a hit. Without a hit every measured request would be a paid
+    LLM call, so stop instead.
+    """
+    httpx.post(url, json=body, timeout=120.0).raise_for_status()
+    response = httpx.post(url, json=body, timeout=120.0)
+    response.raise_for_status()
+    metadata = response.json().get("metadata", {})
+    if not metadata.get("cached"):
+        raise RuntimeError(
+            "Priming did not produce a cache hit, refusing to run the load test "
+            f"(it would send every request to the LLM). Second response metadata: {metadata}. "
+            "Check the LLM and MCP server, and use a read-only --message."
+        )
+
+
+def measure(url: str, body: dict | None, duration: float, clients: int, concurrency: int) -> dict:
+    results = multiprocessing.Queue()
+    procs = [
+        multiprocessing.Process(target=_client_process, args=(url, body, duration, concurrency, results))
+        for _ in range(clients)
+    ]
+    for proc in procs:
+        proc.start()
+    totals = {"ok": 0, "cache_hits": 0, "errors": 0}
+    for _ in procs:
+        for name, value in results.get(timeout=duration + 60).items():
+            totals[name] += value
+    for proc in procs:
+        proc.join()
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend throughput vs worker count")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--message", default="How much have I spent this month?", help="chat question to repeat")
+    parser.add_argument("--path", default=None, help="GET this route instead of the chat endpoint")
+    parser.add_argument("--settle", type=float, default=5.0, help="seconds to let every worker finish warm-up")
+    parser.add_argument("--port", type=int, default=8169)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--concurrency", type=int, default=32, help="in-flight requests per client process")
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = []
+    for workers in args.workers:
+        server = subprocess.Popen(
+            [sys.executable, "serve.py", "--workers", str(workers), "--port", str(args.port), "--host", "127.0.0.1"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_ready(base_url)
+            time.sleep(args.settle)
+
+            if args.path:
+                url, body = f"{base_url}{args.path}", None
+            else:
+                url, body = f"{base_url}/api/chat", {"message": args.message}
+                prime_cache(url, body)
+
+            totals = measure(url, body, args.duration, args.clients, args.concurrency)
+            rps = totals["ok"] / args.duration
+            results.append((workers, rps))
+            hit_ratio = totals["cache_hits"] / totals["ok"] if totals["ok"] else 0.0
+            print(
+                f"{workers} worker(s): {rps:,.0f} req/s, "
+                f"{hit_ratio:.1%} cache hits, {totals['errors']} errors"
+            )
+        finally:
+            server.terminate()
+            server.wait()
+
+    baseline = results[0][1]
+    print()
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}")
+    for workers, rps in results:
+        speedup = f"{rps / baseline:>7.2f}x" if baseline else f"{'n/a':>8}"
+        print(f"{workers:>8} {rps:>10,.0f} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# backend/serve.py
+#
+# Run the backend with one or more uvicorn worker processes:
+#   python serve.py --workers 4
+#
+# Each worker runs the app lifespan (MCP client, LLM client, agents) once.
+# State that must be shared between workers, like the answer cache, goes
+# through SHARED_STATE_BACKEND. With more than one worker it defaults to
+# "sqlite" because the in-memory store would give every worker its own copy.
+import argparse
+import os
+
+import uvicorn
+from dotenv import load_dotenv
+
+
+def main():
+    # Load .env first, so its values win over the multi-worker defaults
+    # below (load_dotenv never overrides variables that are already set)
+    load_dotenv("../.env")
+
+    parser = argparse.ArgumentParser(description="Run the Life OS backend")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8069")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", "1")))
+    args = parser.parse_args()
+
+    # Workers are separate processes and inherit this environment. The app
+    # reads WORKERS to warn when the configured store is not shared.
+    os.environ["WORKERS"] = str(args.workers)
+    if args.workers > 1:
+        os.environ.setdefault("SHARED_STATE_BACKEND", "sqlite")
+
+    uvicorn.run("app.main:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
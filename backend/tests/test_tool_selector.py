@@ -0,0 +1,61 @@
+import pytest
+
+from app.services.tool_selector import TOOL_DOMAINS, select_tool_names
+
+EXPENSE_TOOLS = frozenset(TOOL_DOMAINS["expenses"]["tools"])
+EXERCISE_TOOLS = frozenset(TOOL_DOMAINS["exercises"]["tools"])
+ALL_TOOLS = EXPENSE_TOOLS | EXERCISE_TOOLS
+
+
+@pytest.mark.parametrize("message", [
+    "How much time did I spend exercising?",
+    "Show my workouts from last week",
+    "I ran 5km this morning",
+    "Delete my last bench press",
+])
+def test_workout_questions_get_exercise_tools(message):
+    assert select_tool_names(message, ALL_TOOLS) == EXERCISE_TOOLS
+
+
+@pytest.mark.parametrize("message", [
+    "Log a $12 lunch",
+    "What did I buy at the grocery store?",
+    "Show my expenses for October",
+])
+def test_money_questions_get_expense_tools(message):
+    assert select_tool_names(message, ALL_TOOLS) == EXPENSE_TOOLS
+
+
+@pytest.mark.parametrize("message", [
+    # "spent"/"pay"/"cost" can mean time or money, on their own they must not pick a domain
+    "I spent 45 minutes on the treadmill",
+    "I spent an hour on the rowing machine",
+    "How much have I spent this month?",
+    "What did it cost me?",
+])
+def test_time_or_money_words_never_exclude_workout_tools(message):
+    assert EXERCISE_TOOLS <= select_tool_names(message, ALL_TOOLS)
+
+
+@pytest.mark.parametrize("message", [
+    "hello",
+    "How much have I spent this month?",
+    "I bought new running shoes",
+])
+def test_ambiguous_or_mixed_messages_get_every_tool(message):
+    assert select_tool_names(message, ALL_TOOLS) == ALL_TOOLS
+
+
+def test_domain_tools_are_selected_together():
+    selected = select_tool_names("delete that workout", ALL_TOOLS)
+    assert {"delete_exercise", "get_workouts"} <= selected
+
+
+def test_tools_outside_any_domain_are_kept():
+    available = ALL_TOOLS | {"get_weather"}
+    assert select_tool_names("Show my workouts", available) == EXERCISE_TOOLS | {"get_weather"}
+
+
+def test_result_is_limited_to_available_tools():
+    available = frozenset({"get_workouts", "log_expense"})
+    assert select_tool_names("Show my workouts", available) == {"get_workouts"}
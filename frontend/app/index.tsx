@@ -10,6 +10,7 @@ type Message = {
   content: string;
   metadata?: {
     tools_executed: string[];
+    cached?: boolean;
   };
 };
 
@@ -23,4 +23,82 @@ export const sendChatMessage = async (userMessage: string) => {
     console.error("API Error:", error);
     return { role: "assistant", content: "Sorry, I couldn't reach the server." };
   }
-};
\ No newline at end of file
+};
+
+// --- Delta sync ---
+// Keeps a local copy of a table and only fetches what changed since the last cursor.
+// Client helper only: no screen uses it yet, and the mirror lives in memory.
+// To survive restarts the caller must persist the whole TableMirror
+// (cursor and etag together with rows). The app has no storage dependency yet.
+
+export type SyncTable = 'expenses' | 'workout_sessions' | 'exercise_logs';
+
+export type SyncRow = { id: string; [key: string]: unknown };
+
+export type TableMirror = {
+  cursor: number;
+  etag: string | null;
+  rows: Record<string, SyncRow>;
+};
+
+type SnapshotContinuation = { after: string; seq: number };
+
+type SyncPage = {
+  cursor: number;
+  has_more: boolean;
+  snapshot: SnapshotContinuation | null;
+  upserts: SyncRow[];
+  deletes: string[];
+};
+
+export const emptyMirror = (): TableMirror => ({ cursor: 0, etag: null, rows: {} });
+
+// Pull every pending page for one table and return the updated mirror.
+// Returns the same mirror object when nothing changed (HTTP 304).
+export const syncTable = async (table: SyncTable, mirror: TableMirror): Promise<TableMirror> => {
+  let current = mirror;
+  // Set while paging through a full snapshot (cursor 0)
+  let snapshot: SnapshotContinuation | null = null;
+
+  while (true) {
+    const headers: Record<string, string> = {};
+    if (current.etag) {
+      headers['If-None-Match'] = current.etag;
+    }
+
+    let url = `${API_BASE_URL}/api/sync/${table}?since=${current.cursor}`;
+    if (snapshot) {
+      url += `&after=${encodeURIComponent(snapshot.after)}&snapshot_seq=${snapshot.seq}`;
+    }
+
+    const response = await fetch(url, { headers });
+
+    if (response.status === 304) {
+      return current;
+    }
+    if (!response.ok) {
+      throw new Error(`Sync failed for ${table}: ${response.status}`);
+    }
+
+    const page: SyncPage = await response.json();
+    const rows = { ...current.rows };
+    for (const row of page.upserts) {
+      rows[row.id] = row;
+    }
+    for (const id of page.deletes) {
+      delete rows[id];
+    }
+
+    // The server only sends an ETag once the page brings us fully up to date
+    current = {
+      cursor: page.cursor,
+      etag: response.headers.get('ETag'),
+      rows,
+    };
+    snapshot = page.snapshot;
+
+    if (!page.has_more) {
+      return current;
+    }
+  }
+};
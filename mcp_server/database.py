@@ -1,5 +1,6 @@
 from sqlmodel import SQLModel, Field, Session, create_engine
-from datetime import date
+from sqlalchemy import Index
+from datetime import date, datetime, timezone
 from typing import Optional
 import uuid
 from dotenv import load_dotenv
@@ -53,6 +54,23 @@ class ExerciseLog(SQLModel, table=True):
     # Cardio Metrics
     distance_km: Optional[float] = Field(default=None)
 
+class ChangeLog(SQLModel, table=True):
+    """Append-only record of every write, used as the cursor for delta sync"""
+    __tablename__ = "change_log"
+    # Sync filters on table_name and orders/aggregates on seq (max(seq) for
+    # every ETag check, seq > cursor for deltas)
+    __table_args__ = (Index("ix_change_log_table_name_seq", "table_name", "seq"),)
+
+    seq: Optional[int] = Field(default=None, primary_key=True)
+    table_name: str = Field(nullable=False, max_length=50)
+    row_id: uuid.UUID = Field(nullable=False)
+    op: str = Field(nullable=False, max_length=10) # "upsert" or "delete"
+    changed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+def record_change(session: Session, table_name: str, row_id: uuid.UUID, op: str = "upsert"):
+    # Added to the caller's session so it commits atomically with the write
+    session.add(ChangeLog(table_name=table_name, row_id=row_id, op=op))
+
 DATABASE_URL = f"postgresql://{POSTGRE_USER}:{POSTGRE_PASS}@{POSTGRE_IP}:{POSTGRE_PORT}/{POSTGRE_DB_NAME}"
 
 # Echo for debug
@@ -61,6 +79,9 @@ engine = create_engine(DATABASE_URL, echo=False)
 def init_db():
     # create the tables in Postgres if they do not exist
     SQLModel.metadata.create_all(engine)
+    # create_all skips indexes on tables that already exist, add any missing ones
+    for index in ChangeLog.__table__.indexes:
+        index.create(engine, checkfirst=True)
 
 if __name__ == "__main__":
     init_db()
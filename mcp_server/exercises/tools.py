@@ -1,5 +1,6 @@
 # mcp_server/exercises/tools.py
-from database import engine, WorkoutSession, ExerciseLog
+from database import engine, WorkoutSession, ExerciseLog, record_change
+from versioning import bump_data_version
 from sqlmodel import Session, select, func
 from datetime import date
 import uuid
@@ -46,8 +47,10 @@ def execute_log_exercise(
                     workout_date=parsed_date
                 )
                 session.add(workout_session)
-                session.commit()
-                session.refresh(workout_session)
+                record_change(session, "workout_sessions", workout_session.id)
+                # Flush, not commit: parent and child are saved in one transaction,
+                # so a failed exercise insert never leaves an orphan session behind
+                session.flush()
                 
             # CREATE THE CHILD EXERCISE LOG
             exercise_log = ExerciseLog(
@@ -62,7 +65,9 @@ def execute_log_exercise(
             )
             
             session.add(exercise_log)
+            record_change(session, "exercise_logs", exercise_log.id)
             session.commit()
+            bump_data_version()
             
             return f"Successfully logged {exercise_name} to '{session_name}' on {workout_date}."
             
@@ -139,7 +144,9 @@ def execute_delete_exercise(exercise_id: str) -> str:
             
             name = exercise.exercise_name
             session.delete(exercise)
+            record_change(session, "exercise_logs", exercise.id, "delete")
             session.commit()
+            bump_data_version()
             
             return f"Successfully deleted the exercise: {name}."
             
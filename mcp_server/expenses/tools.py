@@ -1,5 +1,6 @@
 # mcp_server/expense/tools.py
-from database import engine, Expense
+from database import engine, Expense, record_change
+from versioning import bump_data_version
 from sqlmodel import Session, select, func 
 from datetime import date
 import uuid
@@ -26,8 +27,10 @@ def execute_log_expense(amount: float, category: str, description: str, transact
         
         with Session(engine) as session:
             session.add(expense)
+            record_change(session, "expenses", expense.id)
             session.commit()
             
+        bump_data_version()
         return f"Successfully logged {category} expense of ${amount:.2f}."
     except Exception as e:
         return f"Failed to log expense: {str(e)}"
@@ -93,7 +96,9 @@ def execute_delete_expense(expense_id: str) -> str:
                 return f"Error: No expense found with ID {expense_id}."
             
             session.delete(expense)
+            record_change(session, "expenses", expense.id, "delete")
             session.commit()
+            bump_data_version()
             
             return f"Successfully deleted the {expense.category} expense for {expense.amount}."
             
@@ -1,8 +1,14 @@
 # mcp_server/main.py
 # from fastapi import FastAPI
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
 import uvicorn
 
+from database import init_db
+from versioning import get_data_version
+from sync.routes import sync_table
+
 from expenses.tools import (
     execute_log_expense, 
     execute_get_expenses,
@@ -17,6 +23,10 @@ from exercises.tools import (
     execute_get_workout_summary
 )
 
+# Create missing tables (e.g. change_log on an existing deployment) before
+# any tool can write, create_all leaves existing tables untouched
+init_db()
+
 # app = FastAPI(title="Life OS Tool Engine")
 mcp = FastMCP("Life_OS_Tools")
 
@@ -32,6 +42,15 @@ mcp.add_tool(execute_get_workouts, name="get_workouts")
 mcp.add_tool(execute_delete_exercise, name="delete_exercise")
 mcp.add_tool(execute_get_workout_summary, name="get_workout_summary")
 
+# Plain HTTP endpoint (not an MCP tool) so the backend can check for data
+# changes without an MCP round trip or exposing it to the LLM.
+@mcp.custom_route("/data-version", methods=["GET"])
+async def data_version(request: Request) -> JSONResponse:
+    return JSONResponse({"data_version": get_data_version()})
+
+# Delta-sync read API for the mobile client's local mirror
+mcp.custom_route("/sync/{table}", methods=["GET"])(sync_table)
+
 # app.mount("/mcp", mcp.sse_app())
 
 # if __name__ == "__main__":
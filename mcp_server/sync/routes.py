@@ -0,0 +1,144 @@
+# mcp_server/sync/routes.py
+from database import engine, Expense, WorkoutSession, ExerciseLog, ChangeLog
+from sqlmodel import Session, select, func
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from typing import Dict, Optional
+import uuid
+
+SYNC_TABLES = {
+    "expenses": Expense,
+    "workout_sessions": WorkoutSession,
+    "exercise_logs": ExerciseLog,
+}
+
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+
+def _latest_seq(session: Session, table_name: str) -> int:
+    statement = select(func.max(ChangeLog.seq)).where(ChangeLog.table_name == table_name)
+    return session.exec(statement).one() or 0
+
+
+def _make_etag(table_name: str, latest_seq: int) -> str:
+    # Identifies the table state, not the request. A client holding this tag
+    # has already applied every change up to latest_seq.
+    return f'W/"{table_name}-{latest_seq}"'
+
+
+def get_changes(
+    table_name: str,
+    since: int,
+    limit: int,
+    if_none_match: Optional[str],
+    after: Optional[uuid.UUID] = None,
+    snapshot_seq: Optional[int] = None,
+) -> Optional[Dict]:
+    """
+    Build a delta page for one table. Returns None when the client's ETag is
+    still current. The page only carries an ETag once it brings the client
+    fully up to date (has_more is False).
+
+    since == 0 returns a full snapshot (rows written before the change log
+    existed have no entries in it), paged by id. While has_more is True the
+    cursor stays 0 and "snapshot" holds the after/seq params for the next
+    page. The last page sets the cursor to the change seq pinned by the
+    first page, so anything written mid-snapshot arrives as a delta.
+    """
+    model = SYNC_TABLES[table_name]
+
+    with Session(engine) as session:
+        latest_seq = _latest_seq(session, table_name)
+        etag = _make_etag(table_name, latest_seq)
+        if if_none_match == etag:
+            return None
+
+        if since == 0:
+            pinned_seq = latest_seq if snapshot_seq is None else snapshot_seq
+            statement = select(model).order_by(model.id).limit(limit + 1)
+            if after is not None:
+                statement = statement.where(model.id > after)
+            rows = session.exec(statement).all()
+
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            return {
+                "etag": None if has_more else _make_etag(table_name, pinned_seq),
+                "cursor": 0 if has_more else pinned_seq,
+                "has_more": has_more,
+                "snapshot": {"after": str(rows[-1].id), "seq": pinned_seq} if has_more else None,
+                "upserts": [row.model_dump(mode="json") for row in rows],
+                "deletes": [],
+            }
+
+        statement = select(ChangeLog).where(
+            ChangeLog.table_name == table_name,
+            ChangeLog.seq > since
+        ).order_by(ChangeLog.seq).limit(limit + 1)
+        changes = session.exec(statement).all()
+
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        # Only the last operation per row matters within a page
+        last_op = {}
+        for change in changes:
+            last_op[change.row_id] = change.op
+
+        upsert_ids = [row_id for row_id, op in last_op.items() if op == "upsert"]
+        deletes = [str(row_id) for row_id, op in last_op.items() if op == "delete"]
+
+        rows = []
+        if upsert_ids:
+            # Rows deleted after this page are missing here, a later page carries the delete
+            rows = session.exec(select(model).where(model.id.in_(upsert_ids))).all()
+
+        return {
+            "etag": None if has_more else etag,
+            "cursor": changes[-1].seq if changes else since,
+            "has_more": has_more,
+            "snapshot": None,
+            "upserts": [row.model_dump(mode="json") for row in rows],
+            "deletes": deletes,
+        }
+
+
+async def sync_table(request: Request) -> Response:
+    """GET /sync/{table}?since=<cursor>&limit=<n>[&after=<id>&snapshot_seq=<seq>]"""
+    table_name = request.path_params["table"]
+    if table_name not in SYNC_TABLES:
+        return JSONResponse({"error": f"Unknown table '{table_name}'."}, status_code=404)
+
+    try:
+        since = int(request.query_params.get("since", 0))
+        limit = int(request.query_params.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return JSONResponse({"error": "'since' and 'limit' must be integers."}, status_code=400)
+    if since < 0 or limit < 1:
+        return JSONResponse({"error": "'since' must be >= 0 and 'limit' >= 1."}, status_code=400)
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    # Snapshot continuation, echoed back from the previous page's "snapshot"
+    try:
+        after = request.query_params.get("after")
+        after = uuid.UUID(after) if after else None
+        snapshot_seq = request.query_params.get("snapshot_seq")
+        snapshot_seq = int(snapshot_seq) if snapshot_seq else None
+    except ValueError:
+        return JSONResponse({"error": "'after' must be a UUID and 'snapshot_seq' an integer."}, status_code=400)
+
+    if_none_match = request.headers.get("if-none-match")
+    try:
+        page = await run_in_threadpool(
+            get_changes, table_name, since, limit, if_none_match, after, snapshot_seq
+        )
+    except Exception as e:
+        return JSONResponse({"error": f"Failed to read changes: {str(e)}"}, status_code=500)
+
+    if page is None:
+        return Response(status_code=304, headers={"ETag": if_none_match})
+
+    etag = page.pop("etag")
+    return JSONResponse(page, headers={"ETag": etag} if etag else None)
@@ -0,0 +1,20 @@
+# mcp_server/versioning.py
+import threading
+import time
+
+# Seeded from the clock so a restarted server never hands out a version
+# that an earlier process already used.
+_data_version = time.time_ns()
+_lock = threading.Lock()
+
+
+def bump_data_version() -> int:
+    """Mark the stored data as changed. Call after every successful write."""
+    global _data_version
+    with _lock:
+        _data_version += 1
+        return _data_version
+
+
+def get_data_version() -> int:
+    return _data_version